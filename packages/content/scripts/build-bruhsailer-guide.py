@@ -11,6 +11,10 @@ This parser extracts:
 
 Usage:
   python3 packages/content/scripts/build-bruhsailer-guide.py
+
+Requires:
+  python3 -m pip install --user beautifulsoup4 lxml
+  python3 -m pip install --user orjson  # optional, faster output write
 """
 
 from __future__ import annotations
@@ -21,7 +25,12 @@ import unicodedata
 from pathlib import Path
 from typing import TypedDict, NotRequired
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[3]
 SOURCE_HTML = ROOT / "bruhsailer.html"
@@ -131,182 +140,229 @@ SKILL_CANONICAL = {
 }
 
 
-def to_ascii(value: str) -> str:
-    """Normalize unicode and whitespace to clean ASCII."""
-    text = value.strip()
-    text = (
-        text.replace("\u2019", "'")
-        .replace("\u2018", "'")
-        .replace("\u201c", '"')
-        .replace("\u201d", '"')
-        .replace("\u2013", "-")
-        .replace("\u2014", "-")
-        .replace("\u2026", "...")
-    )
-    text = unicodedata.normalize("NFKD", text)
-    text = text.encode("ascii", "ignore").decode("ascii")
-    return re.sub(r"\s+", " ", text).strip()
+# Word-number quantities recognised in item phrases ("two buckets")
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4,
+    "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
+    "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18,
+    "nineteen": 19, "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50
+}
 
+# Extended skip words - common non-items in guide text
+_SKIP_WORDS = frozenset({
+    "gp", "gold", "coins", "times", "minutes", "seconds", "steps", "tiles",
+    "worlds", "world", "swag", "look", "female", "character", "male",
+    "account", "step", "authenticator", "guide", "quest", "quests",
+    "diary", "diaries", "task", "tasks", "level", "levels", "xp", "exp",
+    "experience", "chapter", "section", "more", "point", "points",
+    "lap", "laps", "run", "runs", "trip", "trips", "kill", "kills",
+    "time", "hour", "hours", "day", "days", "week", "weeks",
+    "north", "south", "east", "west", "northwest", "northeast",
+    "southwest", "southeast", "way", "path", "route", "spot",
+    "place", "location", "area", "room", "floor", "total",
+    "required", "optional", "recommended", "extra", "spare"
+})
+
+# Action verbs that typically start new instructions
+_ACTION_VERBS = frozenset({
+    "grab", "talk", "run", "go", "head", "walk", "teleport", "buy", "sell",
+    "bank", "deposit", "withdraw", "use", "open", "close", "click", "enter",
+    "exit", "return", "continue", "complete", "finish", "start", "begin",
+    "pick", "pickpocket", "steal", "take", "bring", "drop", "destroy",
+    "equip", "wear", "wield", "remove", "unequip", "eat", "drink", "cook",
+    "burn", "cut", "chop", "mine", "fish", "fletch", "smith", "craft",
+    "make", "create", "light", "read", "speak", "ask", "tell", "give",
+    "receive", "get", "collect", "gather", "dig", "search", "examine",
+    "check", "restore", "recharge", "fill", "empty"
+})
+
+_SKILLS = frozenset(SKILLS)
+
+
+# Pre-compiled patterns; these fire once or more per step, so compiling per
+# call would dominate the regex-heavy hot paths.
+_WS_RE = re.compile(r"\s+")
+
+# One combined scan for stats and items; branches are dispatched on which
+# named group matched. A numeric match is classified as a stat requirement
+# or an item by looking its first word up in the SKILLS set, which avoids
+# spelling every skill name into the pattern as an alternation.
+# The name boundary here is a plain whitespace/punctuation check; the
+# connective alternation that used to run as a lookahead at every scan
+# position now lives in the boundary regexes below, matched once per
+# candidate at match.end().
+_ITEM_STAT_RE = re.compile(
+    # "110 logs", "5 ashes", "15 firemaking", "level 35 woodcutting"
+    r'\b(?:level\s+)?(?P<num>\d+)\s+(?P<numname>[a-zA-Z][a-zA-Z\-\']{1,20}(?:\s+[a-zA-Z\-\']{1,15})?)'
+    r'(?=\s|[,.\(\)]|$)'
+    # "grab a knife", "take two buckets" (action verb context only)
+    r'|(?:grab|take|get|buy|bring|collect|gather|pick|steal|use|equip|wear)\s+'
+    r'(?P<qty>a|an|one|two|three|four|five|six|seven|eight|nine|ten)\s+'
+    r'(?P<wname>[a-zA-Z][a-zA-Z\-\']+)'
+    r'(?=\s|[,.\(\)]|$)',
+    re.IGNORECASE,
+)
 
-def normalize_rich_text(container) -> str:
-    """Extract plain text from rich HTML, preserving structure."""
-    for span in list(container.find_all("span")):
-        style = (span.get("style") or "").lower()
-        if "font-weight: bold" in style:
-            span.name = "strong"
-        elif "font-style: italic" in style:
-            span.name = "em"
-        elif "text-decoration: line-through" in style:
-            span.name = "s"
-        elif "color: rgb(255, 56, 56)" in style:
-            span["class"] = ["guide-warn"]
-        span.attrs.pop("style", None)
+# The old per-position lookaheads, now applied once per candidate match to
+# validate what follows the captured name. Without this check any trailing
+# word is accepted and garbage like "balls of" leaks into the items. As in
+# the old lookaheads, the connectives are deliberately unanchored prefixes
+# ("or" also accepts " ore", "in" accepts " inventory").
+_NUM_ITEM_BOUNDARY_RE = re.compile(
+    r'\s*[,.\(\)]|\s+(?:and|then|to|from|for|in|on|at|with|if|or|but|you|the|your)|$',
+    re.IGNORECASE,
+)
+_WORD_ITEM_BOUNDARY_RE = re.compile(
+    r'\s*[,.\(\)]|\s+(?:and|then|to|from|for|in|on|at|with|if|or|but)|$',
+    re.IGNORECASE,
+)
 
-    for tag in container.find_all(True):
-        tag.attrs.pop("style", None)
-        if tag.name == "input":
-            tag.decompose()
+# Sentence boundaries: period + space + capital
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
 
-    return container.decode_contents().strip()
+# GP stack patterns: "0 gp", "100-500 gp", "100 - 500", "0"
+_GP_RANGE_RE = re.compile(r'(\d+)\s*[-\u2013]\s*(\d+)')
+_GP_SINGLE_RE = re.compile(r'(\d+)\s*(?:gp|gold)?')
+_GP_NOTE_RE = re.compile(r'\d+\s*(?:gp|gold)?\s*[-\u2013]?\s*(.+)', re.IGNORECASE)
 
+# Smart punctuation to plain ASCII, applied in one translate() pass
+_PUNCT_TRANS = str.maketrans({
+    "\u2019": "'",
+    "\u2018": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2026": "...",
+})
 
-def strip_html_tags(html_text: str) -> str:
-    """Remove HTML tags and get plain text."""
-    soup = BeautifulSoup(html_text, "html.parser")
-    return to_ascii(soup.get_text(" "))
+
+def to_ascii(value: str) -> str:
+    """Normalize unicode and whitespace to clean ASCII."""
+    text = unicodedata.normalize("NFKD", value.translate(_PUNCT_TRANS))
+    text = text.encode("ascii", "ignore").decode("ascii")
+    return _WS_RE.sub(" ", text).strip()
 
 
-def extract_items_from_text(text: str) -> list[ItemNeeded]:
+def extract_items_and_stats(text: str) -> tuple[dict[str, ItemNeeded], list[StatNeeded]]:
     """
-    Extract items with quantities from description text.
+    Extract items with quantities and skill requirements in one pass.
 
     Patterns matched:
-    - "110 logs" -> qty=110, name="logs"
-    - "a knife" -> qty=1, name="knife"
-    - "two buckets" -> qty=2, name="buckets"
-    - "grab 5 ashes" -> qty=5, name="ashes"
+    - "110 logs" -> item qty=110, name="logs"
+    - "a knife" -> item qty=1, name="knife"
+    - "two buckets" -> item qty=2, name="buckets"
+    - "grab 5 ashes" -> item qty=5, name="ashes"
+    - "15 firemaking" -> stat skill=Firemaking, level=15
+    - "level 35 woodcutting" -> stat skill=Woodcutting, level=35
     """
-    items: list[ItemNeeded] = []
-    seen_items: set[str] = set()
-
-    # Number words mapping
-    number_words = {
-        "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4,
-        "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
-        "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
-        "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18,
-        "nineteen": 19, "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50
-    }
-
-    # Extended skip words - common non-items in guide text
-    skip_words = {
-        "gp", "gold", "coins", "times", "minutes", "seconds", "steps", "tiles",
-        "worlds", "world", "swag", "look", "female", "character", "male",
-        "account", "step", "authenticator", "guide", "quest", "quests",
-        "diary", "diaries", "task", "tasks", "level", "levels", "xp", "exp",
-        "experience", "chapter", "section", "more", "point", "points",
-        "lap", "laps", "run", "runs", "trip", "trips", "kill", "kills",
-        "time", "hour", "hours", "day", "days", "week", "weeks",
-        "north", "south", "east", "west", "northwest", "northeast",
-        "southwest", "southeast", "way", "path", "route", "spot",
-        "place", "location", "area", "room", "floor", "total",
-        "required", "optional", "recommended", "extra", "spare"
-    }
-
-    # Pattern for numeric quantities: "110 logs", "5 ashes"
-    # More restrictive: item name should be 1-3 words max
-    numeric_pattern = r'\b(\d+)\s+([a-zA-Z][a-zA-Z\-\']{1,20}(?:\s+[a-zA-Z\-\']{1,15})?)(?=\s*[,.\(\)]|\s+(?:and|then|to|from|for|in|on|at|with|if|or|but|you|the|your)|$)'
-
-    for match in re.finditer(numeric_pattern, text, re.IGNORECASE):
-        qty = int(match.group(1))
-        name = match.group(2).strip().lower()
-
-        # Skip quantities over 1000 (probably not items)
-        if qty > 1000:
-            continue
-
-        # Skip if it's a skill level pattern (e.g., "15 firemaking")
-        first_word = name.split()[0]
-        if first_word in SKILLS:
-            continue
-
-        # Skip common non-items
-        if first_word in skip_words or name in skip_words:
-            continue
-
-        # Skip if any word in the name is a skip word
-        name_words = name.split()
-        if any(w in skip_words for w in name_words):
-            continue
-
-        # Skip if name is too long (more than 3 words)
-        if len(name_words) > 3:
-            continue
-
-        # Normalize name - remove trailing 's' for plurals
-        if name.endswith("s") and len(name) > 3 and not name.endswith("ss"):
-            name = name.rstrip("s")
-
-        name_key = name.lower()
-
-        if name_key not in seen_items and qty > 0 and len(name) > 1:
-            seen_items.add(name_key)
-            items.append({"name": name.title(), "qty": qty})
-
-    # Pattern for word quantities: "a knife", "two buckets"
-    # Action verb context pattern
-    action_context = r'(?:grab|take|get|buy|bring|collect|gather|pick|steal|use|equip|wear)\s+'
-    word_pattern = rf'{action_context}(a|an|one|two|three|four|five|six|seven|eight|nine|ten)\s+([a-zA-Z][a-zA-Z\-\']+?)(?=\s*[,.\(\)]|\s+(?:and|then|to|from|for|in|on|at|with|if|or|but)|$)'
-
-    for match in re.finditer(word_pattern, text, re.IGNORECASE):
-        qty_word = match.group(1).lower()
-        qty = number_words.get(qty_word, 1)
-        name = match.group(2).strip().lower()
+    # Keyed by canonical name/skill; dict preserves insertion order and
+    # gives O(1) dedup without a parallel seen-set. Word-quantity items
+    # are collected apart and merged after the loop: the old word scan
+    # ran after the numeric scan, so on a name collision the numeric
+    # quantity wins regardless of position in the text.
+    items: dict[str, ItemNeeded] = {}
+    word_items: dict[str, ItemNeeded] = {}
+    stats: dict[str, StatNeeded] = {}
+
+    # Manual scan loop instead of finditer: the separate scans of the old
+    # patterns could overlap, so the words a numeric capture consumed must
+    # stay visible to the word branch, or an action-verb phrase inside
+    # them ("43 prayer grab a knife") is swallowed and never matched.
+    pos = 0
+    while True:
+        match = _ITEM_STAT_RE.search(text, pos)
+        if match is None:
+            break
+        pos = match.end()
+        kind = match.lastgroup
+
+        if kind == "numname":
+            qty = int(match.group("num"))
+            name = match.group("numname").strip().lower()
+            name_words = name.split()
+            first_word = name_words[0]
+
+            # Resume from the captured name either way; the numeric branch
+            # cannot re-match there (the name contains no digits), and the
+            # word branch gets the same view the old scan had
+            pos = match.start("numname")
+
+            # A leading skill name makes this a stat, not an item (the old
+            # stats pattern had no boundary requirement, so this comes
+            # before the boundary check)
+            if first_word in _SKILLS:
+                if 1 <= qty <= 99:
+                    skill = SKILL_CANONICAL.get(first_word, first_word.title())
+                    stats.setdefault(skill, {"skill": skill, "level": qty})
+                continue
 
-        # Skip skills and common non-items
-        if name.split()[0] in SKILLS:
-            continue
+            # The name must be followed by punctuation, end of text, or a
+            # connective. When the widened two-word capture fails that
+            # check, mirror the old pattern's backtracking and retry with
+            # the single-word name and the boundary right after it.
+            if not _NUM_ITEM_BOUNDARY_RE.match(text, match.end()):
+                single_end = match.start("numname") + len(first_word)
+                if len(name_words) == 2 and _NUM_ITEM_BOUNDARY_RE.match(
+                    text, single_end
+                ):
+                    name_words = name_words[:1]
+                    name = first_word
+                else:
+                    continue
 
-        if name in skip_words or any(sw in name for sw in skip_words):
-            continue
+            # Skip quantities over 1000 (probably not items)
+            if qty > 1000:
+                continue
 
-        name_key = name.lower()
+            # Skip common non-items
+            if first_word in _SKIP_WORDS or name in _SKIP_WORDS:
+                continue
 
-        if name_key not in seen_items and qty > 0 and len(name) > 1:
-            seen_items.add(name_key)
-            items.append({"name": name.title(), "qty": qty})
+            # Skip if any word in the name is a skip word
+            if not _SKIP_WORDS.isdisjoint(name_words):
+                continue
 
-    return items
+            # Skip if name is too long (more than 3 words)
+            if len(name_words) > 3:
+                continue
 
+            # Normalize name - remove trailing 's' for plurals
+            if name.endswith("s") and len(name) > 3 and not name.endswith("ss"):
+                name = name.rstrip("s")
+        else:
+            qty = _NUMBER_WORDS.get(match.group("qty").lower(), 1)
+            name = match.group("wname").strip().lower()
+
+            if not _WORD_ITEM_BOUNDARY_RE.match(text, match.end()):
+                # Same as above: the old pattern would not have matched, so
+                # a verb inside the quantity phrase stays scannable
+                pos = match.start("qty")
+                continue
 
-def extract_stats_from_text(text: str) -> list[StatNeeded]:
-    """
-    Extract skill requirements from description text.
+            # Skip skills and common non-items
+            if name.split()[0] in _SKILLS:
+                continue
 
-    Patterns matched:
-    - "15 firemaking" -> skill=Firemaking, level=15
-    - "level 35 woodcutting" -> skill=Woodcutting, level=35
-    - "35 woodcutting" -> skill=Woodcutting, level=35
-    """
-    stats: list[StatNeeded] = []
-    seen_stats: set[str] = set()
+            if name in _SKIP_WORDS or any(sw in name for sw in _SKIP_WORDS):
+                continue
 
-    # Build skill pattern
-    skill_names = "|".join(sorted(SKILLS, key=len, reverse=True))
+        if qty > 0 and len(name) > 1:
+            target = items if kind == "numname" else word_items
+            target.setdefault(name, {"name": name.title(), "qty": qty})
 
-    # Pattern: "15 firemaking", "level 35 woodcutting"
-    pattern = rf'\b(?:level\s+)?(\d+)\s+({skill_names})\b'
+    for name, item in word_items.items():
+        items.setdefault(name, item)
 
-    for match in re.finditer(pattern, text, re.IGNORECASE):
-        level = int(match.group(1))
-        skill_raw = match.group(2).lower()
-        skill = SKILL_CANONICAL.get(skill_raw, skill_raw.title())
+    # Items stay keyed by canonical name so callers can merge without
+    # re-deriving the keys
+    return items, list(stats.values())
 
-        if skill not in seen_stats and 1 <= level <= 99:
-            seen_stats.add(skill)
-            stats.append({"skill": skill, "level": level})
 
-    return stats
+def extract_items_from_text(text: str) -> dict[str, ItemNeeded]:
+    """Extract only the items from description text (e.g. meta values)."""
+    return extract_items_and_stats(text)[0]
 
 
 def split_into_instructions(plain_text: str) -> list[GuideInstruction]:
@@ -322,21 +378,8 @@ def split_into_instructions(plain_text: str) -> list[GuideInstruction]:
     if not plain_text.strip():
         return instructions
 
-    # Action verbs that typically start new instructions
-    action_verbs = {
-        "grab", "talk", "run", "go", "head", "walk", "teleport", "buy", "sell",
-        "bank", "deposit", "withdraw", "use", "open", "close", "click", "enter",
-        "exit", "return", "continue", "complete", "finish", "start", "begin",
-        "pick", "pickpocket", "steal", "take", "bring", "drop", "destroy",
-        "equip", "wear", "wield", "remove", "unequip", "eat", "drink", "cook",
-        "burn", "cut", "chop", "mine", "fish", "fletch", "smith", "craft",
-        "make", "create", "light", "read", "speak", "ask", "tell", "give",
-        "receive", "get", "collect", "gather", "dig", "search", "examine",
-        "check", "restore", "recharge", "fill", "empty"
-    }
-
     # First, split on sentence boundaries (period + space + capital)
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', plain_text)
+    sentences = _SENTENCE_RE.split(plain_text)
 
     for sentence in sentences:
         sentence = sentence.strip()
@@ -357,7 +400,7 @@ def split_into_instructions(plain_text: str) -> list[GuideInstruction]:
             first_word = segment.split()[0].lower() if segment else ""
 
             # If starts with action verb, it's a new instruction
-            if i > 0 and first_word in action_verbs:
+            if i > 0 and first_word in _ACTION_VERBS:
                 if current:
                     parts.append(current.strip())
                 current = segment
@@ -374,7 +417,7 @@ def split_into_instructions(plain_text: str) -> list[GuideInstruction]:
             part = part.strip()
             if part:
                 # Clean up trailing punctuation issues
-                part = re.sub(r'\s+', ' ', part)
+                part = _WS_RE.sub(" ", part)
                 instructions.append({"text": part})
 
     return instructions
@@ -384,10 +427,8 @@ def parse_gp_stack(gp_text: str) -> GpStack:
     """Parse GP stack text into structured format."""
     result: GpStack = {}
 
-    # Try to extract min/max values
-    # Patterns: "0 gp", "100-500 gp", "100 - 500", "0"
-    range_match = re.search(r'(\d+)\s*[-–]\s*(\d+)', gp_text)
-    single_match = re.search(r'(\d+)\s*(?:gp|gold)?', gp_text)
+    range_match = _GP_RANGE_RE.search(gp_text)
+    single_match = _GP_SINGLE_RE.search(gp_text)
 
     if range_match:
         result["min"] = int(range_match.group(1))
@@ -401,7 +442,7 @@ def parse_gp_stack(gp_text: str) -> GpStack:
         result["max"] = 0
 
     # Check for notes (text after the number)
-    note_match = re.search(r'\d+\s*(?:gp|gold)?\s*[-–]?\s*(.+)', gp_text, re.IGNORECASE)
+    note_match = _GP_NOTE_RE.search(gp_text)
     if note_match:
         note = note_match.group(1).strip()
         if note and not note.isdigit():
@@ -410,58 +451,74 @@ def parse_gp_stack(gp_text: str) -> GpStack:
     return result
 
 
+# Only the guide subtrees matter; skipping scripts, styles, nav, etc. during
+# parsing keeps the tree (and parse time) a fraction of the full document.
+GUIDE_STRAINER = SoupStrainer(
+    class_=re.compile(
+        r"guide-chapter|chapter-title|guide-section|section-header"
+        r"|section-title|step|step-number|step-time|step-description"
+        r"|step-meta|meta-item"
+    )
+)
+
+
 def parse_guide():
     """Parse the BRUHsailer HTML guide into structured JSON."""
-    soup = BeautifulSoup(SOURCE_HTML.read_text(), "html.parser")
-    chapters = []
+    soup = BeautifulSoup(
+        SOURCE_HTML.read_bytes(),
+        "lxml",
+        from_encoding="utf-8",
+        parse_only=GUIDE_STRAINER,
+    )
+    # The chapter/section hierarchy never reaches the output payload, so
+    # append straight to the flat steps list instead of building wrapper
+    # dicts that only get flattened again at the end.
+    steps: list[GuideStep] = []
     step_counter = 1
 
-    for chapter in soup.select(".guide-chapter"):
-        chapter_title_el = chapter.select_one(".chapter-title")
+    for chapter in soup.find_all(class_="guide-chapter"):
+        chapter_title_el = chapter.find(class_="chapter-title")
         chapter_title = to_ascii(chapter_title_el.get_text(" ")) if chapter_title_el else ""
-        chapter_entry = {
-            "title": chapter_title,
-            "sections": [],
-        }
 
-        for section in chapter.select(".guide-section"):
-            section_header = section.select_one(".section-header")
+        for section in chapter.find_all(class_="guide-section"):
+            section_header = section.find(class_="section-header")
             section_id = section_header.get("data-section") if section_header else ""
-            section_title_el = section.select_one(".section-title")
+            section_title_el = section.find(class_="section-title")
             section_title = to_ascii(section_title_el.get_text(" ")) if section_title_el else ""
 
-            section_entry = {
+            section_info: GuideSection = {
                 "id": section_id or section_title,
                 "title": section_title,
                 "description": "",
                 "chapterTitle": chapter_title,
-                "steps": [],
             }
 
-            for step in section.select(".step"):
-                step_number_el = step.select_one(".step-number")
+            for step in section.find_all(class_="step"):
+                step_number_el = step.find(class_="step-number")
                 step_number_label = to_ascii(step_number_el.get_text(" ")) if step_number_el else f"Step {step_counter}"
 
-                step_time_el = step.select_one(".step-time")
+                step_time_el = step.find(class_="step-time")
                 step_time = to_ascii(step_time_el.get_text(" ")) if step_time_el else ""
 
-                step_desc_el = step.select_one(".step-description")
-                step_description_html = normalize_rich_text(step_desc_el) if step_desc_el else ""
-                step_description_plain = strip_html_tags(step_description_html)
+                step_desc_el = step.find(class_="step-description")
+                step_description_plain = (
+                    to_ascii(step_desc_el.get_text(" ")) if step_desc_el else ""
+                )
 
                 # Extract structured data from description
                 instructions = split_into_instructions(step_description_plain)
-                items_needed = extract_items_from_text(step_description_plain)
-                stats_needed = extract_stats_from_text(step_description_plain)
+                items_needed, stats_needed = extract_items_and_stats(
+                    step_description_plain
+                )
 
                 # Parse metadata from step
                 gp_stack: GpStack = {"min": 0, "max": 0}
-                items_from_meta: list[ItemNeeded] = []
+                items_from_meta: dict[str, ItemNeeded] = {}
                 alternative_routes: list[AlternativeRoute] = []
 
-                meta_el = step.select_one(".step-meta")
+                meta_el = step.find(class_="step-meta")
                 if meta_el:
-                    for meta_item in meta_el.select(".meta-item"):
+                    for meta_item in meta_el.find_all(class_="meta-item"):
                         label = to_ascii(meta_item.get_text(" "))
                         value_el = meta_item.find("span")
                         value = to_ascii(value_el.get_text(" ")) if value_el else ""
@@ -472,11 +529,8 @@ def parse_guide():
                             items_from_meta = extract_items_from_text(value)
 
                 # Merge items from meta with items from description
-                seen_item_names = {item["name"].lower() for item in items_needed}
-                for item in items_from_meta:
-                    if item["name"].lower() not in seen_item_names:
-                        items_needed.append(item)
-                        seen_item_names.add(item["name"].lower())
+                for name_key, item in items_from_meta.items():
+                    items_needed.setdefault(name_key, item)
 
                 step_entry: GuideStep = {
                     "stepNumber": step_counter,
@@ -484,33 +538,18 @@ def parse_guide():
                     "description": step_description_plain,
                     "instructions": instructions,
                     "requirements": [],
-                    "section": {
-                        "id": section_entry["id"],
-                        "title": section_entry["title"],
-                        "description": section_entry["description"],
-                        "chapterTitle": chapter_title,
-                    },
+                    "section": section_info,
                     "meta": {
                         "gpStack": gp_stack,
-                        "itemsNeeded": items_needed,
+                        "itemsNeeded": list(items_needed.values()),
                         "statsNeeded": stats_needed,
                         "alternativeRoutes": alternative_routes,
                     },
                 }
 
-                section_entry["steps"].append(step_entry)
+                steps.append(step_entry)
                 step_counter += 1
 
-            chapter_entry["sections"].append(section_entry)
-
-        chapters.append(chapter_entry)
-
-    # Flatten steps for the output
-    steps = []
-    for chapter in chapters:
-        for section in chapter["sections"]:
-            steps.extend(section["steps"])
-
     payload = {
         "title": "BRUHsailer",
         "description": (
@@ -525,9 +564,14 @@ def parse_guide():
     }
 
     OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    with OUTPUT.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=False)
-        handle.write("\n")
+    if orjson is not None:
+        # orjson serializes to a single bytes buffer, far faster than the
+        # pure-Python pretty printer
+        OUTPUT.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        with OUTPUT.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, ensure_ascii=False)
+            handle.write("\n")
 
     # Print statistics
     total_instructions = sum(len(s.get("instructions", [])) for s in steps)
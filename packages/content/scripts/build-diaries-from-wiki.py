@@ -6,14 +6,22 @@ Usage:
   python3 packages/content/scripts/build-diaries-from-wiki.py
 
 Requires:
-  python3 -m pip install --user beautifulsoup4
+  python3 -m pip install --user beautifulsoup4 lxml
+  python3 -m pip install --user orjson  # optional, faster output write
 """
 
+import gzip
 import json
 import re
 import urllib.request
+from collections import defaultdict
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 WIKI_BASE = "https://oldschool.runescape.wiki"
 API_URL = (
     "https://oldschool.runescape.wiki/api.php?"
@@ -64,19 +72,24 @@ ALLOWED_DIARIES = {
 
 ALLOWED_TIERS = {"easy", "medium", "hard", "elite"}
 
+# Pre-compiled patterns; slugify/parse_level run for every table row.
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_TRIM_RE = re.compile(r"^_+|_+$")
+_DIGITS_RE = re.compile(r"\d+")
+
 
 def slugify(text):
     if not text:
         return ""
     text = text.lower().replace("&", "and")
-    text = re.sub(r"[^a-z0-9]+", "_", text)
-    return re.sub(r"^_+|_+$", "", text)
+    text = _SLUG_RE.sub("_", text)
+    return _SLUG_TRIM_RE.sub("", text)
 
 
 def parse_level(level_str):
     if not level_str:
         return None
-    match = re.search(r"\d+", level_str)
+    match = _DIGITS_RE.search(level_str)
     return int(match.group(0)) if match else None
 
 
@@ -95,7 +108,7 @@ def extract_skill_requirements(cell):
     scps = cell.find_all("span", class_="scp")
     requirements = []
     unresolved = []
-    numbers = [int(value) for value in re.findall(r"\d+", text)]
+    numbers = [int(value) for value in _DIGITS_RE.findall(text)]
 
     skills_in_cell = []
     for scp in scps:
@@ -203,8 +216,24 @@ def extract_quest_requirements(cell):
 
 
 def main():
-    html = json.loads(urllib.request.urlopen(API_URL).read())["parse"]["text"]["*"]
-    soup = BeautifulSoup(html, "html.parser")
+    # Ask for gzip; the uncompressed parse payload is a couple of MB and
+    # transfer time dominates the first run
+    request = urllib.request.Request(
+        API_URL,
+        headers={
+            "Accept-Encoding": "gzip",
+            "User-Agent": "skillbound-build/1",
+        },
+    )
+
+    # The context manager closes the response as soon as the payload is
+    # decoded instead of leaving the connection to the garbage collector
+    with urllib.request.urlopen(request) as response:
+        stream = response
+        if response.headers.get("Content-Encoding") == "gzip":
+            stream = gzip.GzipFile(fileobj=response)
+        html = json.load(stream)["parse"]["text"]["*"]
+    soup = BeautifulSoup(html, "lxml")
 
     diaries = {}
     seen_tasks = set()
@@ -235,17 +264,26 @@ def main():
                 "requirements": [],
                 "tasks": [],
                 "wikiUrl": absolute_url(tier_href),
+                # id collisions per slug; stripped before serialization
+                "_id_counts": defaultdict(int),
             }
         return tiers[tier_id]
 
-    for headline in soup.find_all("span", class_="mw-headline"):
-        skill_label = headline.get("id")
-        if not skill_label or skill_label not in SKILL_MAP:
-            continue
-        table = headline.find_parent("h3").find_next_sibling("table")
-        if not table:
-            continue
-
+    # One top-down pass pairing each skill heading with the table that
+    # follows it, instead of a parent/sibling walk per headline. A new
+    # heading before any table clears the pending pair.
+    skill_tables = []
+    pending_skill = None
+    for node in soup.find_all(["h3", "table"]):
+        if node.name == "h3":
+            headline = node.find("span", class_="mw-headline")
+            skill_label = headline.get("id") if headline else None
+            pending_skill = skill_label if skill_label in SKILL_MAP else None
+        elif pending_skill:
+            skill_tables.append(node)
+            pending_skill = None
+
+    for table in skill_tables:
         for row in table.find_all("tr")[1:]:
             cols = row.find_all("td")
             if len(cols) < 6:
@@ -279,6 +317,13 @@ def main():
             if not task_desc:
                 continue
 
+            # Reject duplicate rows before any requirement parsing; the key
+            # only needs the slugs, not the diary/tier entries themselves
+            task_key = "{}|{}|{}".format(slugify(diary_name), tier_id, task_desc)
+            if task_key in seen_tasks:
+                continue
+            seen_tasks.add(task_key)
+
             diary = ensure_diary(
                 diary_name, diary_link.get("href") if diary_link else None
             )
@@ -303,17 +348,9 @@ def main():
                 requirements.append({"type": "manual-check", "label": quest_manual})
 
             base_id = slugify(task_desc) or "task"
-            existing_ids = {task["id"] for task in tier["tasks"]}
-            task_id = base_id
-            suffix = 2
-            while task_id in existing_ids:
-                task_id = "{}_{}".format(base_id, suffix)
-                suffix += 1
-
-            task_key = "{}|{}|{}".format(diary["id"], tier["tier"], task_desc)
-            if task_key in seen_tasks:
-                continue
-            seen_tasks.add(task_key)
+            count = tier["_id_counts"][base_id]
+            tier["_id_counts"][base_id] = count + 1
+            task_id = base_id if count == 0 else "{}_{}".format(base_id, count + 1)
 
             task = {"id": task_id, "description": task_desc, "requirements": requirements}
             if tier.get("wikiUrl"):
@@ -325,6 +362,8 @@ def main():
     for diary in diaries.values():
         tiers = list(diary["tiers"].values())
         tiers.sort(key=lambda t: tier_order.get(t["tier"], 99))
+        for tier in tiers:
+            tier.pop("_id_counts", None)
         diary_obj = {
             "id": diary["id"],
             "name": diary["name"],
@@ -338,8 +377,12 @@ def main():
     result_diaries.sort(key=lambda d: d["name"])
 
     output_path = "packages/content/src/bundles/diaries-2026-01-22.json"
-    with open(output_path, "w") as handle:
-        json.dump(result_diaries, handle, indent=2)
+    if orjson is not None:
+        with open(output_path, "wb") as handle:
+            handle.write(orjson.dumps(result_diaries, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as handle:
+            json.dump(result_diaries, handle, indent=2, ensure_ascii=False)
 
     print("diaries", len(result_diaries))
     print("tasks", sum(len(t["tasks"]) for d in result_diaries for t in d["tiers"]))